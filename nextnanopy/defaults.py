@@ -1,4 +1,6 @@
 import os
+import mmap
+import functools
 from pathlib import Path
 from nextnanopy.utils.config import Config
 
@@ -72,20 +74,25 @@ def get_fmt(product):
 
 
 def input_file_type(fullpath):
-    from nextnanopy.nnp.defaults import is_nnp_input_file
-    from nextnanopy.nn3.defaults import is_nn3_input_file
-    from nextnanopy.negf.defaults import is_negf_input_file
-    from nextnanopy.msb.defaults import is_msb_input_file
-    if is_nn3_input_file(fullpath):
-        return 'nextnano3'
-    elif is_nnp_input_file(fullpath):
-        return 'nextnano++'
-    elif is_negf_input_file(fullpath):
-        return 'nextnano.NEGF'
-    elif is_msb_input_file(fullpath):
-        return 'nextnano.MSB'
-    else:
+    # the modification time and size are part of the cache key so that an edited file is scanned again
+    stat = os.stat(fullpath)
+    return _input_file_type(os.path.abspath(fullpath), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _input_file_type(fullpath, mtime_ns, size):
+    if size == 0:
         return 'not valid'
+    # search the raw bytes of the memory-mapped file, same priority order as input_text_type
+    with open(fullpath, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for product in ['nextnano3', 'nextnano++', 'nextnano.NEGF', 'nextnano.MSB']:
+                if mm.find(get_fmt(product)['input_pattern'].encode()) != -1:
+                    return product
+        finally:
+            mm.close()
+    return 'not valid'
 
 
 def input_text_type(text):
@@ -518,8 +518,13 @@ class InputFile(InputFileTemplate):
     #         setattr(self, key, self._helper_input_file.__dict__[key])
 
     def __new__(cls, fullpath=None, configpath=None, *args, **kwargs):
-        preInputFile = InputFileTemplate(fullpath,configpath)
-        _InputFileType = defaults.get_InputFile(preInputFile.product)
+        if fullpath is None:
+            product = 'not valid'
+        else:
+            product = defaults.input_file_type(fullpath)
+            if product not in defaults.products:
+                product = 'Not valid'
+        _InputFileType = defaults.get_InputFile(product)
         return _InputFileType(fullpath, configpath)
 
     # def load_variables(self):
@@ -772,23 +777,23 @@ class Sweep(InputFileTemplate):
         self.create_info()
 
     def create_input_files(self, round_decimal, integer_only_in_name = False):
-        iteration_combinations = list(itertools.product(*self.var_sweep.values()))
+        var_names = list(self.var_sweep.keys())
+        var_values = [list(values) for values in self.var_sweep.values()]
+        # each value is formatted for the file name once, not once per combination it appears in
+        name_parts = [['{}_{}_'.format(var_name, value if isinstance(value, str) else round(value, round_decimal))
+                       for value in values]
+                      for var_name, values in zip(var_names, var_values)]
         filename_path, filename_extension = os.path.splitext(self.fullpath)
-        for combination in iteration_combinations:
-            filename_end = '__'
+        for combination, combination_names in zip(itertools.product(*var_values), itertools.product(*name_parts)):
             inputfile = InputFile(fullpath = self.fullpath, configpath = self.configpath)
-            for var_name, var_value in zip(self.var_sweep.keys(), combination):
+            for var_name, var_value in zip(var_names, combination):
                 inputfile.set_variable(var_name, var_value, comment='THIS VARIABLE IS UNDER SWEEP')
-                if isinstance(var_value,str):
-                    var_value_string = var_value
-                else:
-                    var_value_string = round(var_value, round_decimal)
-                filename_end += '{}_{}_'.format(var_name, var_value_string)
+            filename_end = '__' + ''.join(combination_names)
             if integer_only_in_name:
                 inputfile.save(overwrite = False)
             else:
                 inputfile.save(filename_path + filename_end + filename_extension, overwrite = True)
-            variable_combination =  dict(zip(self.var_sweep.keys(), combination))
+            variable_combination =  dict(zip(var_names, combination))
             self.input_files.append(inputfile)
             self.sweep_infodict[inputfile.fullpath] = variable_combination
 
@@ -872,9 +877,7 @@ class Sweep(InputFileTemplate):
         raise NotImplementedError
 
     def mk_dir(self,overwrite = False, output_directory = None):
-        vars = ''
-        for i in self.var_sweep.keys():
-            vars+=('__'+i)
+        vars = ''.join('__' + i for i in self.var_sweep.keys())
         name_of_file = self.filename_only
         if not output_directory:
             output_directory = self.config.get(section = self.product,option = 'outputdirectory')
@@ -1,6 +1,6 @@
 import numpy as np
 from nextnanopy.utils.mycollections import DictList
-from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate
+from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate, avs_extensions
 from nextnanopy.utils.datasets import Variable, Coord
 import re
 
@@ -11,7 +11,7 @@ class DataFile(DataFileTemplate):
         self.load()
 
     def get_loader(self):
-        if self.extension in ['.v', '.fld', '.coord']:
+        if self.extension in avs_extensions:
             loader = AvsAscii
         elif self.extension == '.txt':
             raise NotImplementedError(f'Loading nextnano.MSB datafiles with extension.txt is not implemented yet')
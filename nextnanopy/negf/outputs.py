@@ -1,6 +1,6 @@
 import numpy as np
 from nextnanopy.utils.mycollections import DictList
-from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate
+from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate, avs_extensions
 from nextnanopy.utils.datasets import Variable, Coord
 import re
 import os
@@ -12,7 +12,7 @@ class DataFile(DataFileTemplate):
         self.load(**loader_kwargs)
 
     def get_loader(self):
-        if self.extension in ['.v', '.fld', '.coord']:
+        if self.extension in avs_extensions:
             loader = AvsAscii
         elif self.extension == '.txt':
             raise NotImplementedError(f'Loading nextnano.NEGF datafiles with extension.txt is not implemented yet')
@@ -141,10 +141,8 @@ def get_WannierStark_norm(folder,scaling_factor = 1):
     return z, pot, ws_norm_scal
 
 def scale_wf(wf_input,factor):
-    scaled = np.copy(wf_input)
-    for i, cur  in enumerate(wf_input):
-        mi = min(cur)
-        ma = max(cur)
-        scaled[i] = np.interp(cur,[mi,ma],[mi,factor*(ma-mi)+mi])
-        
+    # linear map of each row from [min, max] onto [min, min + factor*(max - min)], done for all rows at once
+    wf_input = np.asarray(wf_input)
+    mi = wf_input.min(axis=-1, keepdims=True)
+    scaled = (mi + factor * (wf_input - mi)).astype(wf_input.dtype, copy=False)
     return scaled
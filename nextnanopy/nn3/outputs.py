@@ -1,6 +1,6 @@
 import numpy as np
 from nextnanopy.utils.mycollections import DictList
-from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate
+from nextnanopy.outputs import Output, AvsAscii, DataFileTemplate, avs_extensions
 from nextnanopy.nn3.defaults import parse_nn3_variable, is_nn3_variable, InputVariable_nn3
 from nextnanopy.utils.datasets import Variable, Coord
 from nextnanopy.utils.formatting import best_str_to_name_unit
@@ -12,7 +12,7 @@ class DataFile(DataFileTemplate):
         self.load(**loader_kwargs)
 
     def get_loader(self):
-        if self.extension in ['.v', '.fld', '.coord']:
+        if self.extension in avs_extensions:
             loader = AvsAscii
         elif self.extension == '.txt':
             loader = self._find_txt_loader()
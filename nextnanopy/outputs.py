@@ -1,4 +1,6 @@
 import os
+import re
+import functools
 from itertools import islice
 import numpy as np
 import struct
@@ -12,6 +14,15 @@ from nextnanopy import defaults
 
 
 
+avs_extensions = frozenset(('.v', '.fld', '.coord'))
+
+@functools.lru_cache(maxsize=32)
+def _keywords_matcher(keywords):
+    # one lookahead per keyword: the name matches only if it contains all of them, in any order.
+    # match anchors the lookaheads at the start of the name, search would retry them at every position
+    pattern = ''.join(f'(?=.*{re.escape(key)})' for key in keywords)
+    return re.compile(pattern, re.DOTALL).match
+
 _msgs = defaults.messages['load_output']
 load_message = lambda method: message_decorator(method, init_msg=_msgs[0], end_msg=_msgs[1])
 def displayname(data):
@@ -78,11 +89,18 @@ class DataFolder(object):
 
         find(template, deep = False):
             searches for a files which names contain template.
-            template shoud be string.
+            template shoud be string or list of strings.
+            if template is a list, searches for files which names contain all of them.
             if deep = True, searches in subfolders as well.
 
             return: list of files
 
+        file(filename, on_ambiguous = None):
+            returns the path of the file in the folder which name contains filename.
+            if more than one file matches and on_ambiguous is None, warns and returns the first match.
+            otherwise on_ambiguous is called with the list of matching files and its result is returned,
+            e.g. to select a file by a fixed rule or to raise an error in scripted workflows.
+
         go_to(*args):
             goes to the location
             DataFolder_path\\arg1\\arg2\\arg3...
@@ -105,14 +123,14 @@ class DataFolder(object):
         self.create_navigation()
 
     def load(self):
-        list_of_nodes = os.listdir(self.fullpath)
-        for node in list_of_nodes:
-            node_path = os.path.join(self.fullpath, node)
-            if os.path.isdir(node_path):
-                new_folder = DataFolder(node_path)
-                self.folders[node] = new_folder
-            else:
-                self.files.append(node_path)
+        # os.scandir provides the entry type from the directory listing, so no extra stat call per node
+        with os.scandir(self.fullpath) as nodes:
+            for node in nodes:
+                if node.is_dir():
+                    new_folder = DataFolder(node.path)
+                    self.folders[node.name] = new_folder
+                else:
+                    self.files.append(node.path)
 
     def create_navigation(self):
         check_list = dir(self)
@@ -124,23 +142,34 @@ class DataFolder(object):
                 setattr(self, key, folder)
 
     def find(self, template, deep=False):
-        list_of_files = [file for file in self.files if template in os.path.basename(file)]
-        if not deep:
-            return list_of_files
-        if not self.folders:
-            return list_of_files
+        if isinstance(template, str):
+            template = [template]
+        # longer keywords are usually more selective, so they are tested first
+        template = tuple(sorted(template, key=len, reverse=True))
+        if len(template) == 1:
+            key = template[0]
+            match = lambda name: key in name
         else:
+            match = _keywords_matcher(template)
+        list_of_files = []
+        self._find(match, deep, list_of_files)
+        return list_of_files
+
+    def _find(self, match, deep, list_of_files):
+        list_of_files.extend(file for file in self.files if match(os.path.basename(file)))
+        if deep:
             for folder in self.folders:
-                list_of_files += folder.find(template=template, deep=deep)
-            return list_of_files
+                folder._find(match, deep, list_of_files)
 
 
-    def file(self, filename):
+    def file(self, filename, on_ambiguous=None):
         matched_files = self.find(template = filename, deep = False)
         if not matched_files:
             raise ValueError(f'No file with filename {filename} in directory {self.fullpath}')
         elif len(matched_files) == 1:
             return matched_files[0]
+        elif on_ambiguous is not None:
+            return on_ambiguous(matched_files)
         else:
             warnings.warn(f"More than one file match '{filename}' name match in directory {self.fullpath}. First match returned.")
             return matched_files[0]
@@ -381,8 +410,12 @@ class DataFile(DataFileTemplate):
         if self.product:
             loader = defaults.get_DataFile(self.product)
         else:
-            print('[Warning] nextnano product is not specified: nextnano++, nextnano3, nextnano.NEGF or nextnano.MSB')
-            print('[Warning] Autosearching for the best loading method. Note: The result may not be correct')
+            # stacklevel points at the caller's DataFile(...) line, so the warning is shown once per call site
+            # instead of on every file, e.g. when loading the outputs of a sweep.
+            # frames: get_loader < load < message_decorator < DataFileTemplate.__init__ < DataFile.__init__ < caller
+            warnings.warn('nextnano product is not specified: nextnano++, nextnano3, nextnano.NEGF or nextnano.MSB. '
+                          'Autosearching for the best loading method. Note: The result may not be correct',
+                          stacklevel=6)
             loader = self.find_loader()
         return loader
 
@@ -1,7 +1,15 @@
+import os
+import functools
 import configparser
 from copy import deepcopy
 
 
+@functools.lru_cache(maxsize=8)
+def _read_text(fullpath, mtime_ns, size):
+    with open(fullpath, 'r') as file:
+        return file.read()
+
+
 class Config(object):
     """
         This class stores and manipulates a configuration file.
@@ -76,7 +84,14 @@ class Config(object):
         self.validate_config()
 
     def read_file(self):
-        self.configparser.read(self.fullpath)
+        # every input file loads the same config file, so its text is cached until the file changes
+        # like configparser.read, files that cannot be opened are skipped
+        try:
+            stat = os.stat(self.fullpath)
+            text = _read_text(os.path.abspath(self.fullpath), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return
+        self.configparser.read_string(text, source=self.fullpath)
 
     def configparser_to_config(self):
         self.config = deepcopy(self.configparser._sections)
@@ -114,6 +129,7 @@ class Config(object):
             self.fullpath = fullpath
         with open(self.fullpath, 'w') as file:
             self.configparser.write(file)
+        _read_text.cache_clear()
 
     def config_to_configparser(self):
         for sec in self.sections:
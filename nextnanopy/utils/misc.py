@@ -1,29 +1,27 @@
 import os
+import functools
 import numpy as np
 
 def is_file(fullpath):
-    filename = os.path.split(fullpath)[-1]
-    if '.' not in filename:
-        bool = False
-    else:
-        bool = True
-    return bool
+    return '.' in os.path.basename(fullpath)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_filename(fullpath, ext=True):
-    if not is_file(fullpath):
+    filename = os.path.basename(fullpath)
+    if '.' not in filename:
         raise ValueError(f'{fullpath} is not a file')
-    filename = os.path.split(fullpath)[-1]
     if not ext:
         filename = os.path.splitext(filename)[0]
     return filename
 
 
+@functools.lru_cache(maxsize=1024)
 def get_file_extension(fullpath):
-    if not is_file(fullpath):
+    filename = os.path.basename(fullpath)
+    if '.' not in filename:
         raise ValueError(f'{fullpath} is not a file')
-    filename = os.path.split(fullpath)[-1]
-    ext = f".{filename.split('.')[-1]}"
+    ext = filename[filename.rfind('.'):]
     return ext
 
 
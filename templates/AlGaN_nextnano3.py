@@ -43,6 +43,7 @@ def detect_software(folder_path, filename):
         sys.exit()
 
     InputPath = os.path.join(folder_path, filename)
+    software = None
     with open(InputPath,'r') as file:
         for line in file:
             if 'simulation-flow-control' in line:
@@ -64,6 +65,7 @@ def detect_software(folder_path, filename):
                 software = 'nextnano.MSB'
                 software_short = '_nnMSB'
                 FileExtension = '.xml'
+                break
                 
     if not software:   # if the variable is empty
         print('ERROR: Software cannot be detected! Please check your input file.')
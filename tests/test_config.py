@@ -161,5 +161,22 @@ class Test_NNConfig(unittest.TestCase):
         if os.path.isfile(config.fullpath):
             os.remove(config.fullpath)
 
+    def test_reload_saved(self):
+        fullpath = os.path.join('tests', '.nextnanopy-config')
+        config = NNConfig(fullpath)
+        config.set('nextnano++', 'exe', 'path_a')
+        config.save()
+        self.assertEqual(NNConfig(fullpath).config['nextnano++']['exe'], 'path_a')
+        stat = os.stat(fullpath)
+
+        # same size and modification time: only clearing the cache on save reveals the new value
+        config.set('nextnano++', 'exe', 'path_b')
+        config.save()
+        os.utime(fullpath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(fullpath).st_size, stat.st_size)
+        self.assertEqual(NNConfig(fullpath).config['nextnano++']['exe'], 'path_b')
+        if os.path.isfile(config.fullpath):
+            os.remove(config.fullpath)
+
 if __name__ == '__main__':
     unittest.main()
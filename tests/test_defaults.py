@@ -1,6 +1,8 @@
 import unittest
 from nextnanopy.utils import mycollections
 import os
+import shutil
+import tempfile
 from nextnanopy import defaults
 from nextnanopy.nnp import defaults as nnp_defaults
 from nextnanopy.nn3 import defaults as nn3_defaults
@@ -55,6 +57,46 @@ class TestFormatting(unittest.TestCase):
         self.assertEqual(defaults.get_fmt('nextnano.NEGF')['com_char'], '<!--')
         self.assertEqual(defaults.get_fmt('nextnano.NEGF')['input_pattern'], '<Simulation')
 
+    def test_input_file_type_modified(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fullpath = os.path.join(tmpdir, 'example.in')
+            shutil.copyfile(os.path.join(folder_nnp, 'example.in'), fullpath)
+            defaults._input_file_type.cache_clear()
+            self.assertEqual(defaults.input_file_type(fullpath), 'nextnano++')
+            self.assertEqual(defaults._input_file_type.cache_info().hits, 0)
+            self.assertEqual(defaults.input_file_type(fullpath), 'nextnano++')
+            self.assertEqual(defaults._input_file_type.cache_info().hits, 1)
+            self.assertEqual(defaults._input_file_type.cache_info().currsize, 1)
+            shutil.copyfile(os.path.join(folder_nn3, 'example.in'), fullpath)
+            self.assertEqual(defaults.input_file_type(fullpath), 'nextnano3')
+            self.assertEqual(defaults._input_file_type.cache_info().hits, 1)
+            self.assertEqual(defaults._input_file_type.cache_info().currsize, 2)
+            open(fullpath, 'w').close()
+            self.assertEqual(defaults.input_file_type(fullpath), 'not valid')
+            with open(fullpath, 'w') as f:
+                f.write('#' * 100000 + '\n')
+                with open(os.path.join(folder_nnp, 'example.in'), 'r') as example:
+                    f.write(example.read())
+            self.assertEqual(defaults.input_file_type(fullpath), 'nextnano++')
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_input_file_type_priority_after_head(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fullpath = os.path.join(tmpdir, 'example.in')
+            with open(fullpath, 'w') as f:
+                f.write('! this comment mentions global{ of nextnano++\n')
+                f.write('!' * 100000 + '\n')
+                with open(os.path.join(folder_nn3, 'example.in'), 'r') as example:
+                    f.write(example.read())
+            self.assertEqual(defaults.input_file_type(fullpath), 'nextnano3')
+            with open(fullpath, 'r') as f:
+                self.assertEqual(defaults.input_file_type(fullpath), defaults.input_text_type(f.read()))
+        finally:
+            shutil.rmtree(tmpdir)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 import warnings
 
+import numpy as np
 import nextnanopy.outputs as outputs
+from nextnanopy.negf.outputs import scale_wf
 from nextnanopy.utils.datasets import default_unit
 from os.path import join
 import os
@@ -493,6 +495,29 @@ class TestOutputs_negf(unittest.TestCase):
         for file in files:
             self.assertRaises(NotImplementedError, outputs.DataFile, join(folder_negf, file), 'nextnano.NEGF')
 
+    def test_scale_wf(self):
+        def scale_wf_per_row(wf_input, factor):
+            scaled = np.copy(wf_input)
+            for i, cur in enumerate(wf_input):
+                mi = min(cur)
+                ma = max(cur)
+                scaled[i] = np.interp(cur, [mi, ma], [mi, factor * (ma - mi) + mi])
+            return scaled
+
+        wf = np.array([[0.1, 0.5, 0.3, 0.2],
+                       [-1.0, 2.0, 0.5, 1.5],
+                       [0.7, 0.7, 0.7, 0.7]])
+        for factor in [1, 2.5, 0.3]:
+            scaled = scale_wf(wf, factor)
+            self.assertEqual(scaled.shape, wf.shape)
+            self.assertEqual(scaled.dtype, wf.dtype)
+            self.assertTrue(np.allclose(scaled, scale_wf_per_row(wf, factor)))
+
+        wf32 = wf.astype(np.float32)
+        scaled = scale_wf(wf32, 2.5)
+        self.assertEqual(scaled.dtype, np.float32)
+        self.assertTrue(np.allclose(scaled, scale_wf_per_row(wf32, 2.5)))
+
 
 class TestOutputs_msb(unittest.TestCase):
 
@@ -574,6 +599,14 @@ class TestOutput(unittest.TestCase):
         for i, dfi in enumerate(df):
             self.assertEqual(df.data[i], dfi)
 
+    def test_warn_product_not_specified(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            outputs.DataFile(join(folder_nnp, 'bandedges_1d.dat'))
+        w = [wi for wi in w if 'product is not specified' in str(wi.message)]
+        self.assertEqual(len(w), 1)
+        self.assertEqual(w[0].filename, __file__)
+
 class TestDataFolder(unittest.TestCase):
     def test_init(self):
         dummy_folder = os.path.join('tests','dummy')
@@ -624,6 +657,20 @@ class TestDataFolder(unittest.TestCase):
         self.assertNotIn('only_variables.in',datafolder.filenames())
         self.assertNotIn(os.path.join(folder_nnp, 'only_variables.in'),datafolder.filenames())
 
+    def test_find_multiple(self):
+        datafolder = outputs.DataFolder(folder_nnp)
+        self.assertEqual(datafolder.find(['only', '.in']), [os.path.join(folder_nnp, 'only_variables.in')])
+        self.assertEqual(datafolder.find(['only', '.txt']), [])
+        self.assertEqual(len(datafolder.find(['bandedges', 'avs'], deep=True)), 6)
+        self.assertEqual(sorted(datafolder.find(['bandedges'], deep=True)),
+                         sorted(datafolder.find('bandedges', deep=True)))
+        datafolder = outputs.DataFolder(folder_negf)
+        self.assertEqual(datafolder.find(['(Kane', 'E_p', '.dat']), [os.path.join(folder_negf, 'E_p (Kane energy).dat')])
+
+        match = outputs._keywords_matcher(('bandedges', 'Gamma', '.dat'))
+        self.assertTrue(match('x' * 5000 + '_Gamma_bandedges.dat'))
+        self.assertFalse(match('bandedges_' + 'x' * 5000 + '.dat'))
+
     def test_find(self):
         tests_folder = 'tests'
         datafolder = outputs.DataFolder(tests_folder)
@@ -717,6 +764,17 @@ class TestDataFolder(unittest.TestCase):
         self.assertTrue(datafolder.datafiles.folders['nextnano++'].file('bandedges'))
         warnings.filterwarnings('default')
 
+    def test_file_on_ambiguous(self):
+        datafolder = outputs.DataFolder(folder_nnp)
+        matched_files = datafolder.find('bandedges')
+        self.assertEqual(datafolder.file('bandedges', on_ambiguous=lambda files: files[-1]), matched_files[-1])
+        self.assertEqual(datafolder.file('only_variables', on_ambiguous=lambda files: None),
+                         os.path.join(folder_nnp, 'only_variables.in'))
+
+        def raise_error(files):
+            raise LookupError(files)
+        self.assertRaises(LookupError, datafolder.file, 'bandedges', on_ambiguous=raise_error)
+
 
     def test_make_tree(self):
         tests_folder = 'tests'